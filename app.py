@@ -3,20 +3,61 @@ import sys
 import time
 import json
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from tkinter import ttk
+from tkinter import font as tkfont
+from watchdog.events import PatternMatchingEventHandler, FileCreatedEvent
 import subprocess
-from datetime import datetime
-from PIL import Image, ImageTk
+import shutil
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import threading
+from collections import deque
+from itertools import islice
 
 CONFIG_FILE = "video_player_config.json"
+SEEN_FILE = "video_player_seen.json"
+ERROR_ALREADY_EXISTS = 183  # Win32 error returned when a named mutex already exists
+DRIVE_REMOTE = 4  # GetDriveTypeW result for mapped network drives
 custom_title = "Wolfie_AV_Player"
 
+# Timestamp format used in the activity log
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Lower-case file extensions treated as videos
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv'})
+
+# Debounce for bursts of new files (seconds): the first file is handled at once, later ones
+# are batched until the folder is quiet for DEBOUNCE_IDLE, flushing at least every DEBOUNCE_MAX
+DEBOUNCE_IDLE = 0.2
+DEBOUNCE_MAX = 0.5
+
+# Repeat events for the same path within DUPLICATE_WINDOW are ignored; entries expire after RECENT_TTL
+DUPLICATE_WINDOW = 0.5
+RECENT_TTL = 5.0
+
+# How often a new file's size is checked while it is still being written (milliseconds)
+WRITE_POLL_MS = 100
+
+# Played-file records kept across restarts, and how often they are written out (milliseconds)
+MAX_SEEN_VIDEOS = 5000
+SEEN_SAVE_MS = 5000
+
+# How often network folders are rescanned (seconds)
+POLL_INTERVAL = 2.0
+
+# Oldest activity-log entries are dropped beyond this
+MAX_LOG_LINES = 500
+
+# How often queued activity-log lines are written to the widget (milliseconds)
+LOG_PUMP_MS = 100
+
 def create_ico_from_png(png_path, ico_path):
     """Convert PNG to ICO format for Windows"""
     try:
+        # Pillow is only needed here, so keep it out of startup
+        from PIL import Image
         img = Image.open(png_path)
         icon_sizes = [(16,16), (32, 32), (48,48), (64,64)]
         img.save(ico_path, format='ICO', sizes=icon_sizes)
@@ -25,44 +66,450 @@ def create_ico_from_png(png_path, ico_path):
         print(f"Failed to convert PNG to ICO: {e}")
         return False
 
-def load_config():
+def ico_is_stale(png_path, ico_path):
+    """Return True if the ICO is missing or older than the PNG it was made from"""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"hot_folder": os.path.expanduser("~")}
+        ico_mtime = os.path.getmtime(ico_path)
+    except OSError:
+        return True
+    try:
+        return ico_mtime < os.path.getmtime(png_path)
+    except OSError:
+        # No source PNG to rebuild from; keep using the shipped ICO
+        return False
 
-def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f)
+def native_observer_class():
+    """Return the event-driven watchdog observer for this platform, never the polling one"""
+    try:
+        if sys.platform.startswith('linux'):
+            from watchdog.observers.inotify import InotifyObserver as observer_class
+        elif sys.platform == 'darwin':
+            from watchdog.observers.fsevents import FSEventsObserver as observer_class
+        elif sys.platform.startswith('win'):
+            from watchdog.observers.read_directory_changes import WindowsApiObserver as observer_class
+        else:
+            from watchdog.observers import Observer as observer_class
+    except ImportError as e:
+        print(f"Native file observer unavailable ({e}), using watchdog default")
+        from watchdog.observers import Observer as observer_class
+    return observer_class
+
+def is_network_path(path):
+    """Return True for UNC paths and mapped network drives"""
+    if path.startswith(('\\\\', '//')):
+        return True
+    if sys.platform.startswith('win'):
+        import ctypes
+        drive = os.path.splitdrive(os.path.abspath(path))[0]
+        if drive:
+            return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == DRIVE_REMOTE
+    return False
+
+class ScandirPollingObserver(threading.Thread):
+    """Observer for network shares that rescans one folder with os.scandir and reports new videos
+
+    Scans only compare names, so a file deleted and copied back under the same name within one
+    POLL_INTERVAL is never reported.
+    """
+
+    def __init__(self, interval=POLL_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self._handler = None
+        self._folder = None
+        self._known = None  # Video names from the last scan; None until the folder is first scanned
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()  # Cuts the wait short so a newly scheduled folder is scanned at once
+
+    def schedule(self, event_handler, path, recursive=False):
+        with self._lock:
+            self._handler = event_handler
+            self._folder = path
+            self._known = None
+        self._wake.set()
+
+    def unschedule_all(self):
+        with self._lock:
+            self._handler = None
+            self._folder = None
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake.set()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self._wake.clear()
+            self._poll()
+            self._wake.wait(self.interval)
+
+    def _poll(self):
+        with self._lock:
+            handler, folder, known = self._handler, self._folder, self._known
+        if handler is None:
+            return
+        try:
+            # Unlike watchdog's PollingObserver nothing is stat'ed, since on a share each stat is a round trip;
+            # DirEntry.is_file() reads the file type the directory listing already returned
+            with os.scandir(folder) as entries:
+                names = {entry.name for entry in entries
+                         if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS and entry.is_file()}
+        except OSError as e:
+            print(f"Failed to scan {folder}: {e}")
+            return
+
+        with self._lock:
+            if folder != self._folder:
+                return  # Rescheduled while scanning
+            self._known = names
+        # The first scan only records what is already there
+        if known is None:
+            return
+        for name in sorted(names - known):
+            handler.dispatch(FileCreatedEvent(os.path.join(folder, name)))
+
+class WatchfilesObserver(threading.Thread):
+    """Observer backed by watchfiles, whose Rust core batches native notifications into one list per tick"""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._handler = None
+        self._folder = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._rewatch = threading.Event()  # Ends the current watch so run() picks up a new folder
+
+    def schedule(self, event_handler, path, recursive=False):
+        with self._lock:
+            self._handler = event_handler
+            self._folder = path
+        self._rewatch.set()
+
+    def unschedule_all(self):
+        with self._lock:
+            self._handler = None
+            self._folder = None
+        self._rewatch.set()
+
+    def stop(self):
+        self._stop_event.set()
+        self._rewatch.set()
+
+    def run(self):
+        from watchfiles import Change, watch
+
+        def is_new_video(change, path):
+            return change == Change.added and os.path.splitext(path)[1].lower() in VIDEO_EXTENSIONS
+
+        while not self._stop_event.is_set():
+            with self._lock:
+                handler, folder = self._handler, self._folder
+                self._rewatch.clear()
+            if handler is None:
+                self._rewatch.wait()
+                continue
+            try:
+                for changes in watch(folder, watch_filter=is_new_video, stop_event=self._rewatch,
+                                     debounce=int(DEBOUNCE_MAX * 1000), recursive=False):
+                    for _, path in sorted(changes):
+                        handler.dispatch(FileCreatedEvent(path))
+            except Exception as e:
+                print(f"Failed to watch {folder}: {e}")
+                self._stop_event.wait(POLL_INTERVAL)
+
+def observer_class_for(folder):
+    """Pick the observer for a folder; network shares are polled since their change notifications are unreliable"""
+    if is_network_path(folder):
+        return ScandirPollingObserver
+    # watchfiles is optional; prefer it when installed without importing it here
+    if importlib.util.find_spec('watchfiles') is not None:
+        return WatchfilesObserver
+    return native_observer_class()
+
+def format_log_row(row):
+    """Render a (detected_at, text) activity-log row"""
+    detected_at, text = row
+    if detected_at is None:
+        return text
+    return f"{time.strftime(TIME_FORMAT, time.localtime(detected_at))} - {text}"
+
+def drain_queue(pending):
+    """Return everything currently in a queue without blocking"""
+    items = []
+    while True:
+        try:
+            items.append(pending.get_nowait())
+        except queue.Empty:
+            return items
+
+@functools.lru_cache(maxsize=None)
+def opener_path(name):
+    """Resolve the system file opener to an absolute path once"""
+    return shutil.which(name) or name
+
+# Last config read from or written to disk, so unchanged saves skip the file entirely
+_config_cache = None
 
-class VideoHandler(FileSystemEventHandler):
-    def __init__(self, delay, callback):
+def load_config():
+    global _config_cache
+    if _config_cache is None:
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                _config_cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"hot_folder": os.path.expanduser("~")}
+    return dict(_config_cache)
+
+def save_config(config):
+    global _config_cache
+    if config == _config_cache:
+        return
+    # Write to a temp file and swap it in so a crash never leaves a truncated config
+    tmp_file = CONFIG_FILE + '.tmp'
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(config, f)
+            # Make sure the data is on disk before the rename can be
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
+    except OSError:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    _config_cache = dict(config)
+
+class SeenVideos:
+    """Played files keyed by path and mtime, persisted so copying an unchanged file in again doesn't replay it"""
+
+    def __init__(self, path=SEEN_FILE):
+        self.path = path
+        self._keys = {}  # Insertion-ordered set, oldest first
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(path, 'r') as f:
+                self._keys = dict.fromkeys(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    @staticmethod
+    def key(video_path, mtime_ns):
+        return f"{video_path}:{mtime_ns}"
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._keys
+
+    def add(self, key):
+        with self._lock:
+            self._keys.pop(key, None)
+            self._keys[key] = None
+            while len(self._keys) > MAX_SEEN_VIDEOS:
+                del self._keys[next(iter(self._keys))]
+            self._dirty = True
+
+    def clear(self):
+        """Forget every played file so each one can be played again"""
+        with self._lock:
+            self._keys.clear()
+            self._dirty = True
+
+    def save(self):
+        """Write the records if they changed since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return
+            keys = list(self._keys)
+            self._dirty = False
+        tmp_file = self.path + '.tmp'
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(keys, f)
+            os.replace(tmp_file, self.path)
+        except OSError as e:
+            print(f"Failed to save seen videos: {e}")
+
+class VideoHandler(PatternMatchingEventHandler):
+    def __init__(self, app, delay, callback, seen):
+        # Let watchdog drop directories and non-video files before on_created is called
+        super().__init__(patterns=[f'*{ext}' for ext in sorted(VIDEO_EXTENSIONS)], ignore_directories=True, case_sensitive=False)
+        self.app = app
         self.delay = delay
         self.callback = callback
+        self.seen = seen
         self.is_paused = False
         self.is_running = True
+        # stop() puts None on both queues so their threads block on get() instead of polling is_running
+        self._queue = queue.Queue()
+        self._worker = None
+        # (path, deadline) of detected files to play once fully written, handled by _settle_writes
+        self._settling = queue.Queue()
+        self._settler = None
+        self._recent = {}  # path -> time.monotonic() of its last event
+        # Launching a player can block (ShellExecute, slow openers), so it never runs on the Tk thread
+        self._launcher = ThreadPoolExecutor(max_workers=2, thread_name_prefix='player-launch')
+        # Held while submitting a launch and while stopping, so nothing is submitted after shutdown
+        self._launch_lock = threading.Lock()
+
+    def start(self):
+        """Start the worker threads that debounce queued events and wait for new files to settle"""
+        self._worker = threading.Thread(target=self._process_events, daemon=True)
+        self._worker.start()
+        # Stat and open calls can block for seconds on network shares, so they stay off the Tk thread
+        self._settler = threading.Thread(target=self._settle_writes, daemon=True)
+        self._settler.start()
 
     def on_created(self, event):
-        if not self.is_paused and not event.is_directory and self.is_running and event.src_path.lower().endswith(('.mp4', '.avi', '.mkv')):
-            video_name = os.path.basename(event.src_path)
-            detection_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.callback(f"{detection_time} - {video_name}")
-            print(f"New video detected: {event.src_path}")
-            time.sleep(self.delay)
-            self.play_video(event.src_path)
+        if self.is_paused or not self.is_running:
+            return
+        now = time.monotonic()
+        path = event.src_path
+        # Some backends report one new file several times in quick succession
+        if now - self._recent.get(path, -DUPLICATE_WINDOW) < DUPLICATE_WINDOW:
+            return
+        self._recent = {p: t for p, t in self._recent.items() if now - t < RECENT_TTL}
+        self._recent[path] = now
+        self._queue.put((path, now))
+
+    def _process_events(self):
+        """Handle the first event of a burst immediately, then batch the ones that follow"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, first_seen = item
+            self._handle_batch({path: first_seen})
+
+            # A dict keeps arrival order and collapses duplicate events for the same file
+            batch = {}
+            window_start = time.monotonic()
+            while True:
+                try:
+                    item = self._queue.get(timeout=DEBOUNCE_IDLE)
+                except queue.Empty:
+                    break
+                if item is None:
+                    return
+                path, seen = item
+                batch.setdefault(path, seen)
+                if time.monotonic() - window_start >= DEBOUNCE_MAX:
+                    self._handle_batch(batch)
+                    batch = {}
+                    window_start = time.monotonic()
+
+            if batch and self.is_running:
+                self._handle_batch(batch)
+
+    def _handle_batch(self, batch):
+        # This is the only worker thread, so one bad batch must not stop detection for good
+        try:
+            self._flush(batch)
+        except Exception as e:
+            print(f"Failed to handle new videos {list(batch)}: {e}")
+
+    def _flush(self, batch):
+        """Queue log rows for the Tk main loop and hand new files to the settle thread"""
+        detected_at = time.time()
+        deadline = time.monotonic() + self.delay
+        for video_path in batch:
+            self.callback(detected_at, os.path.basename(video_path))
+            print(f"New video detected: {video_path}")
+            self._settling.put((video_path, deadline))
+
+    def _settle_writes(self):
+        """Poll waiting files every WRITE_POLL_MS until each one is played or gone"""
+        waiting = {}  # path -> (size at the last poll, deadline)
+        while True:
+            items = drain_queue(self._settling) if waiting else [self._settling.get()]
+            for item in items:
+                if item is None:
+                    return
+                video_path, deadline = item
+                waiting.setdefault(video_path, (-1, deadline))
+
+            for video_path, (last_size, deadline) in list(waiting.items()):
+                if not self.is_running:
+                    return
+                try:
+                    size = self._play_when_written(video_path, last_size, deadline)
+                except Exception as e:
+                    print(f"Failed to wait for {video_path}: {e}")
+                    size = None
+                if size is None:
+                    del waiting[video_path]
+                else:
+                    waiting[video_path] = (size, deadline)
+
+            if waiting:
+                time.sleep(WRITE_POLL_MS / 1000)
+
+    def _play_when_written(self, video_path, last_size, deadline):
+        """Play once the file size is stable between two polls; the delay setting caps the wait
+
+        Returns the current size while the file is still being written, None once it is done with
+        """
+        try:
+            stat = os.stat(video_path)
+        except OSError:
+            print(f"Video disappeared before playback: {video_path}")
+            self.app.add_status_to_list(f"{os.path.basename(video_path)} disappeared before playback")
+            return None
+
+        size = stat.st_size
+        settled = size > 0 and size == last_size and self._is_unlocked(video_path)
+        if settled or time.monotonic() >= deadline:
+            # Checked and recorded with the same finished-file mtime, so a copy that keeps the
+            # original mtime is skipped however long it took to write
+            key = SeenVideos.key(video_path, stat.st_mtime_ns)
+            if key in self.seen:
+                self.app.add_status_to_list(f"Skipped {os.path.basename(video_path)} (already played)")
+                return None
+            with self._launch_lock:
+                # A file that settles after stop() is not played
+                if self.is_running:
+                    self.seen.add(key)
+                    self._launcher.submit(self._launch, video_path)
+            return None
+        return size
+
+    def _is_unlocked(self, video_path):
+        """On Windows a writer that denies sharing makes the open fail until it is done"""
+        if not sys.platform.startswith('win'):
+            return True
+        try:
+            fd = os.open(video_path, os.O_RDONLY)
+        except OSError:
+            return False
+        os.close(fd)
+        return True
 
-    def play_video(self, video_path):
+    def _launch(self, video_path):
         try:
+            self.play_video(video_path)
+        except Exception as e:
+            print(f"Failed to play {video_path}: {e}")
+
+    def play_video(self, video_path):
+        if hasattr(os, 'startfile'):
             os.startfile(video_path)
-        except AttributeError:
-            if sys.platform.startswith('darwin'):
-                subprocess.call(('open', video_path))
-            else:
-                subprocess.call(('xdg-open', video_path))
+            return
+
+        opener = opener_path('open' if sys.platform.startswith('darwin') else 'xdg-open')
+        # An absolute path with close_fds=False (Python fds are non-inheritable anyway) and no
+        # cwd/preexec_fn/start_new_session lets subprocess use posix_spawn instead of fork+exec
+        subprocess.Popen([opener, video_path],
+                         stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL,
+                         close_fds=False)
 
     def stop(self):
-        self.is_running = False
+        with self._launch_lock:
+            self.is_running = False
+            self._launcher.shutdown(wait=False)
+        self._queue.put(None)
+        self._settling.put(None)
 
 class Application(tk.Tk):
     def __init__(self):
@@ -102,6 +549,15 @@ class Application(tk.Tk):
         self.delay = 5
         self.video_count = 0
         self.is_watching = True
+
+        # Log lines from any thread, handled by _drain_pending
+        self._pending = queue.Queue()
+
+        # Activity log model of (detected_at, text) rows, detected_at being None for status
+        # messages; rows are only formatted once they scroll into view
+        self._log_rows = deque(maxlen=MAX_LOG_LINES)
+        self._log_top = 0
+        self._log_follow = True  # Keep the newest entry in view until the user scrolls up
         
         # Observer management
         self.observer = None
@@ -121,8 +577,12 @@ class Application(tk.Tk):
         self.style.configure('Header.TLabel', background=bg_color, font=('Segoe UI', 14, 'bold'))
         self.style.configure('Info.TLabel', background=bg_color, font=('Segoe UI', 9))
         
+        self.seen_videos = SeenVideos()
+
         self.create_widgets()
         self.start_watching()
+        self.after(LOG_PUMP_MS, self._drain_pending)
+        self.after(SEEN_SAVE_MS, self._save_seen_videos)
         
         # Ensure proper cleanup on exit
         self.protocol("WM_DELETE_WINDOW", self.safe_exit)
@@ -130,14 +590,43 @@ class Application(tk.Tk):
     def instance_check(self):
         """Prevent multiple instances of the application"""
         try:
-            import socket
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.bind(('localhost', 0))
-            self.socket.listen(1)
-        except Exception:
+            if sys.platform.startswith('win'):
+                import ctypes
+                kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+                # Windows closes the mutex handle when the process exits, even after a crash
+                self.instance_lock = kernel32.CreateMutexW(None, False, 'Global\\Wolfie_AV_Player')
+                already_running = ctypes.get_last_error() == ERROR_ALREADY_EXISTS
+            else:
+                import fcntl
+                import tempfile
+                # flock is dropped by the OS when the process exits, so a stale file never blocks startup
+                self.instance_lock = open(os.path.join(tempfile.gettempdir(), 'wolfie_av_player.lock'), 'w')
+                try:
+                    fcntl.flock(self.instance_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    already_running = False
+                except BlockingIOError:
+                    already_running = True
+        except Exception as e:
+            print(f"Failed to acquire instance lock: {e}")
+            return
+
+        if already_running:
+            from tkinter import messagebox
             messagebox.showerror("Error", "Another instance of the application is already running.")
             sys.exit(1)
 
+    def release_instance_lock(self):
+        """Release the lock taken in instance_check"""
+        lock = getattr(self, 'instance_lock', None)
+        if not lock:
+            return
+        if sys.platform.startswith('win'):
+            import ctypes
+            ctypes.windll.kernel32.CloseHandle(lock)
+        else:
+            lock.close()
+        self.instance_lock = None
+
     def set_app_icon(self):
         try:
             icon_path = 'icon.png'  # Make sure your icon.png is in the same directory
@@ -145,7 +634,7 @@ class Application(tk.Tk):
             if sys.platform.startswith('win'):
                 # For Windows
                 ico_path = icon_path.replace('.png', '.ico')
-                if not os.path.exists(ico_path):
+                if ico_is_stale(icon_path, ico_path):
                     create_ico_from_png(icon_path, ico_path)
                 self.iconbitmap(ico_path)
             else:
@@ -217,31 +706,87 @@ class Application(tk.Tk):
         info_frame = ttk.Frame(video_frame, style='Custom.TFrame')
         info_frame.pack(fill='x', pady=(0, 10))
 
-        self.count_label = ttk.Label(info_frame, text="Videos Detected: 0", style='Info.TLabel')
+        self._count_var = tk.StringVar(value="Videos Detected: 0")
+        self.count_label = ttk.Label(info_frame, textvariable=self._count_var, style='Info.TLabel')
         self.count_label.pack(side='left')
 
         clear_btn = ttk.Button(info_frame, text="Clear Log", style='Custom.TButton', 
                              command=self.clear_log)
         clear_btn.pack(side='right')
 
-        # Custom text widget for log
+        reset_btn = ttk.Button(info_frame, text="Reset Played", style='Custom.TButton',
+                             command=self.reset_played)
+        reset_btn.pack(side='right', padx=5)
+
+        # Custom text widget for log; it is a fixed-height viewport onto self._log_rows
+        log_font = ('Consolas', 10)
         self.video_log = tk.Text(video_frame, 
-                                wrap=tk.WORD,
-                                font=('Consolas', 10),
+                                wrap='none',
+                                font=log_font,
                                 bg='white',
                                 fg='#333333',
                                 borderwidth=1,
                                 relief='solid',
                                 height=10)
         self.video_log.pack(side='left', fill='both', expand=True)
+        self._log_line_height = max(1, tkfont.Font(font=log_font).metrics('linespace'))
 
         # Scrollbar
-        scrollbar = ttk.Scrollbar(video_frame, orient="vertical", command=self.video_log.yview)
-        scrollbar.pack(side='right', fill='y')
-        self.video_log.config(yscrollcommand=scrollbar.set)
+        self._log_scrollbar = ttk.Scrollbar(video_frame, orient="vertical", command=self._scroll_log)
+        self._log_scrollbar.pack(side='right', fill='y')
+
+        # Scrolling moves the window over the model instead of the widget's own contents
+        self.video_log.bind('<Configure>', lambda event: self._render_log())
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.video_log.bind(sequence, self._on_log_wheel)
         
         # Make text widget read-only
         self.video_log.config(state='disabled')
+        self._render_log()
+
+    def _visible_log_rows(self):
+        log = self.video_log
+        chrome = 2 * (int(log.cget('borderwidth')) + int(log.cget('highlightthickness')) + int(log.cget('pady')))
+        return max(1, (log.winfo_height() - chrome) // self._log_line_height)
+
+    def _scroll_log(self, action, amount, unit=None):
+        """Scrollbar and mouse-wheel handler; translates the request into a new first visible row"""
+        visible = self._visible_log_rows()
+        bottom = max(0, len(self._log_rows) - visible)
+        if action == 'moveto':
+            top = int(float(amount) * len(self._log_rows))
+        else:
+            step = visible if unit == 'pages' else 1
+            top = self._log_top + int(amount) * step
+        self._log_top = min(max(0, top), bottom)
+        self._log_follow = self._log_top >= bottom
+        self._render_log()
+        return 'break'
+
+    def _on_log_wheel(self, event):
+        # Windows and macOS send <MouseWheel> with a delta, X11 sends <Button-4>/<Button-5>
+        step = -3 if event.num == 4 or event.delta > 0 else 3
+        return self._scroll_log('scroll', step, 'units')
+
+    def _render_log(self):
+        """Redraw only the rows that fit in the widget"""
+        visible = self._visible_log_rows()
+        total = len(self._log_rows)
+        bottom = max(0, total - visible)
+        if self._log_follow:
+            self._log_top = bottom
+        self._log_top = min(self._log_top, bottom)
+
+        rows = islice(self._log_rows, self._log_top, self._log_top + visible)
+        self.video_log.config(state='normal')
+        self.video_log.delete('1.0', tk.END)
+        self.video_log.insert('1.0', "\n".join(format_log_row(row) for row in rows))
+        self.video_log.config(state='disabled')
+
+        if total:
+            self._log_scrollbar.set(self._log_top / total, min(1.0, (self._log_top + visible) / total))
+        else:
+            self._log_scrollbar.set(0.0, 1.0)
 
     def toggle_watching(self):
         self.is_watching = not self.is_watching
@@ -249,31 +794,65 @@ class Application(tk.Tk):
             self.toggle_button.config(text="Pause")
             self.status_label.config(foreground='green')
             self.event_handler.is_paused = False
-            self.add_video_to_list("Monitoring resumed")
+            self.add_status_to_list("Monitoring resumed")
         else:
             self.toggle_button.config(text="Start")
             self.status_label.config(foreground='red')
             self.event_handler.is_paused = True
-            self.add_video_to_list("Monitoring paused")
+            self.add_status_to_list("Monitoring paused")
 
     def clear_log(self):
-        self.video_log.config(state='normal')
-        self.video_log.delete(1.0, tk.END)
-        self.video_log.config(state='disabled')
+        self._log_rows.clear()
+        self._log_top = 0
+        self._log_follow = True
+        self._render_log()
         self.video_count = 0
-        self.count_label.config(text=f"Videos Detected: {self.video_count}")
+        self._count_var.set(f"Videos Detected: {self.video_count}")
 
-    def add_video_to_list(self, video_info):
-        self.video_log.config(state='normal')
-        self.video_log.insert(tk.END, f"{video_info}\n")
-        self.video_log.see(tk.END)
-        self.video_log.config(state='disabled')
-        
-        if not video_info.startswith("Monitoring"):  # Don't count status messages
-            self.video_count += 1
-            self.count_label.config(text=f"Videos Detected: {self.video_count}")
+    def reset_played(self):
+        """Forget which files were already played so they are no longer skipped"""
+        self.seen_videos.clear()
+        self.add_status_to_list("Played video records cleared")
+
+    def add_video_to_list(self, detected_at, video_name):
+        """Queue a detected video; safe to call from any thread"""
+        self._pending.put((detected_at, video_name))
+
+    def add_status_to_list(self, message):
+        """Queue a status message; these are not counted as detections"""
+        self._pending.put((None, message))
+
+    def _drain_pending(self):
+        """Move every queued log row into the model with a single redraw, then reschedule"""
+        try:
+            rows = drain_queue(self._pending)
+            if rows:
+                self._write_log(rows)
+        finally:
+            self.after(LOG_PUMP_MS, self._drain_pending)
+
+    def _write_log(self, rows):
+        """Append rows to the activity log and update the detection counter"""
+        # Keep a scrolled-back view on the same entries when old ones fall off the front
+        dropped = max(0, len(self._log_rows) + len(rows) - MAX_LOG_LINES)
+        self._log_top = max(0, self._log_top - dropped)
+        self._log_rows.extend(rows)
+        self._render_log()
+
+        detected = sum(1 for detected_at, _ in rows if detected_at is not None)
+        if detected:
+            self.video_count += detected
+            self._count_var.set(f"Videos Detected: {self.video_count}")
+
+    def _save_seen_videos(self):
+        """Write played-file records at most once per SEEN_SAVE_MS"""
+        try:
+            self.seen_videos.save()
+        finally:
+            self.after(SEEN_SAVE_MS, self._save_seen_videos)
 
     def browse_folder(self):
+        from tkinter import filedialog
         new_folder = filedialog.askdirectory(initialdir=self.hot_folder)
         if new_folder:
             self.hot_folder = new_folder
@@ -282,12 +861,22 @@ class Application(tk.Tk):
             self.restart_observer()
 
     def restart_observer(self):
-        self.observer.stop()
-        self.observer.join()
-        self.start_watching()
+        """Point the running observer at the new folder, rebuilding it only if it died or the folder needs another backend"""
+        from tkinter import messagebox
+        if (self.observer and self.observer.is_alive()
+                and type(self.observer) is observer_class_for(self.hot_folder)):
+            try:
+                self.observer.unschedule_all()
+                self.observer.schedule(self.event_handler, self.hot_folder, recursive=False)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to start watching folder: {str(e)}")
+                return
+        else:
+            self.start_watching()
         messagebox.showinfo("Success", "Watch folder updated successfully")
 
     def update_settings(self):
+        from tkinter import messagebox
         try:
             new_delay = float(self.delay_entry.get())
             if new_delay < 0:
@@ -305,14 +894,16 @@ class Application(tk.Tk):
             if self.observer:
                 self.stop_watching()
             
-            self.event_handler = VideoHandler(self.delay, self.add_video_to_list)
-            self.observer = Observer()
+            self.event_handler = VideoHandler(self, self.delay, self.add_video_to_list, self.seen_videos)
+            self.event_handler.start()
+            observer_class = observer_class_for(self.hot_folder)
+            print(f"Watching {self.hot_folder} with {observer_class.__name__}")
+            self.observer = observer_class()
             self.observer.schedule(self.event_handler, self.hot_folder, recursive=False)
-            
-            # Use a daemon thread for the observer to ensure it can be stopped
-            observer_thread = threading.Thread(target=self.observer.start, daemon=True)
-            observer_thread.start()
+            # Observer is itself a thread, so start() returns immediately
+            self.observer.start()
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Error", f"Failed to start watching folder: {str(e)}")
 
     def stop_watching(self):
@@ -335,10 +926,10 @@ class Application(tk.Tk):
             
             # Save configuration
             save_config({"hot_folder": self.hot_folder})
+            self.seen_videos.save()
             
-            # Close the socket to release the instance lock
-            if hasattr(self, 'socket'):
-                self.socket.close()
+            # Release the instance lock
+            self.release_instance_lock()
             
             # Destroy the window
             self.destroy()
@@ -349,15 +940,20 @@ class Application(tk.Tk):
             print(f"Error during exit: {e}")
             sys.exit(1)
 
+    def report_callback_exception(self, exc_type, exc_value, exc_traceback):
+        """Log errors raised inside Tk callbacks and keep the application running"""
+        import traceback
+        from tkinter import messagebox
+        print("Error in callback:", exc_type.__name__, exc_value)
+        traceback.print_exception(exc_type, exc_value, exc_traceback)
+        messagebox.showerror("Error", str(exc_value))
+
 def handle_exception(exc_type, exc_value, exc_traceback):
-    """Global exception handler to log unexpected errors"""
+    """Global exception handler to log unexpected errors outside the Tk main loop"""
     import traceback
-    # Log the error
+    # Log the error; errors in Tk callbacks go to Application.report_callback_exception instead
     print("Uncaught exception:", exc_type.__name__, exc_value)
     traceback.print_exception(exc_type, exc_value, exc_traceback)
-    
-    # Prevent the default error dialog
-    sys.exit(1)
 
 # Set the global exception handler
 sys.excepthook = handle_exception
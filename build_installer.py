@@ -1,14 +1,74 @@
 import os
 import sys
+import json
+import hashlib
+import importlib
 import subprocess
 import shutil
 from pathlib import Path
-from PIL import Image
+
+# Script PyInstaller bundles into the executable
+ENTRY_SCRIPT = 'app.py'
+
+# Files whose content decides whether PyInstaller has to run again
+BUILD_INPUTS = [ENTRY_SCRIPT, 'icon.png', 'icon.ico', 'video_player_config.json']
+
+# Hashes from the last successful build steps
+BUILD_CACHE_FILE = '.build_cache.json'
+
+# pip output goes here so it doesn't bury the build steps' own messages
+PIP_LOG_FILE = 'build_pip.log'
+
+# Inno Setup script for the installer; raw string to avoid escaping issues
+INNO_SCRIPT = r'''[Setup]
+AppName=Wolfie AV Player
+AppVersion=1.0
+AppPublisher=Grey_wolf_indie
+DefaultDirName={autopf}\Wolfie AV Player
+DefaultGroupName=Wolfie AV Player
+AllowNoIcons=yes
+LicenseFile=LICENSE.txt
+OutputDir=installer
+OutputBaseFilename=Wolfie_AV_Player_Setup
+SetupIconFile=icon.ico
+Compression=lzma
+SolidCompression=yes
+WizardStyle=modern
+
+[Languages]
+Name: "english"; MessagesFile: "compiler:Default.isl"
+
+[Tasks]
+Name: "desktopicon"; Description: "{cm:CreateDesktopIcon}"; GroupDescription: "{cm:AdditionalIcons}"; Flags: unchecked
+
+[Files]
+Source: "dist\Wolfie_AV_Player\*"; DestDir: "{app}"; Flags: ignoreversion recursesubdirs createallsubdirs
+
+[Icons]
+Name: "{group}\Wolfie AV Player"; Filename: "{app}\Wolfie_AV_Player.exe"
+Name: "{group}\Uninstall Wolfie AV Player"; Filename: "{uninstallexe}"
+Name: "{autodesktop}\Wolfie AV Player"; Filename: "{app}\Wolfie_AV_Player.exe"; Tasks: desktopicon
+
+[Run]
+Filename: "{app}\Wolfie_AV_Player.exe"; Description: "Launch Wolfie AV Player"; Flags: postinstall nowait skipifsilent
+'''
+
+# Stdlib and tooling packages the app never imports; leaving them out shrinks the bundle
+EXCLUDED_MODULES = [
+    'test',
+    'tkinter.test',
+    'unittest',
+    'pydoc_data',
+    'distutils',
+    'setuptools',
+    'pip'
+]
 
 # Ensure you have the required packages
 REQUIRED_PACKAGES = [
     'pillow',
     'watchdog',
+    'watchfiles',
     'pyinstaller',
     'tk'
 ]
@@ -19,22 +79,66 @@ def check_python_version():
         print("Error: Python 3.7+ is required.")
         sys.exit(1)
 
+def load_build_cache():
+    try:
+        with open(BUILD_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def update_build_cache(key, value):
+    cache = load_build_cache()
+    cache[key] = value
+    with open(BUILD_CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+def file_hashes(paths):
+    """Map each existing path to the sha256 of its content"""
+    hashes = {}
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                hashes[path] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+def pip_command(*args):
+    """Build a pip command, using uv's native installer when it is on PATH"""
+    uv = shutil.which('uv')
+    if uv:
+        # uv needs to be told which interpreter's environment to manage
+        return [uv, 'pip', args[0], '--python', sys.executable, *args[1:]]
+    return [sys.executable, '-m', 'pip', *args]
+
+def installed_packages_hash():
+    """Hash of `pip freeze` plus the requested packages, so either changing forces a reinstall"""
+    freeze = subprocess.check_output(pip_command('freeze'))
+    return hashlib.sha256(freeze + json.dumps(REQUIRED_PACKAGES).encode()).hexdigest()
+
+def executable_path():
+    exe_name = 'Wolfie_AV_Player.exe' if sys.platform.startswith('win') else 'Wolfie_AV_Player'
+    return Path('dist') / 'Wolfie_AV_Player' / exe_name
+
 def install_requirements():
-    """Install required packages"""
-    print("Installing required packages...")
+    """Install required packages and return the hash of the resulting environment"""
     try:
-        # Upgrade pip first
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'])
-        
-        for package in REQUIRED_PACKAGES:
-            try:
-                subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
-                print(f"Successfully installed {package}")
-            except subprocess.CalledProcessError:
-                print(f"Failed to install {package}")
-                raise
+        # Nothing to do if the environment is exactly what the last install left behind
+        packages_hash = installed_packages_hash()
+        if load_build_cache().get('packages') == packages_hash:
+            print("Required packages are up to date.")
+            return packages_hash
+
+        print(f"Installing required packages (log: {PIP_LOG_FILE})...")
+        # One run installs everything, so the installer and resolver start once; pip also upgrades itself
+        packages = REQUIRED_PACKAGES if shutil.which('uv') else ['pip', *REQUIRED_PACKAGES]
+        with open(PIP_LOG_FILE, 'w') as log:
+            subprocess.check_call(pip_command('install', '--upgrade', *packages),
+                                  stdout=log, stderr=subprocess.STDOUT)
+        print(f"Successfully installed {', '.join(REQUIRED_PACKAGES)}")
+        packages_hash = installed_packages_hash()
+        update_build_cache('packages', packages_hash)
+        return packages_hash
     except Exception as e:
-        print(f"Error installing packages: {e}")
+        print(f"Error installing packages: {e} (see {PIP_LOG_FILE} for pip's output)")
         sys.exit(1)
 
 def create_icon():
@@ -42,102 +146,105 @@ def create_icon():
     try:
         # Use Path for cross-platform file handling
         icon_path = Path('icon.png')
+        ico_path = Path('icon.ico')
         
         # Check if PNG exists
         if not icon_path.exists():
             print("Error: icon.png not found!")
             sys.exit(1)
 
-        # Create ICO file
-        img = Image.open(icon_path)
+        # Skip the conversion when the ICO is already newer than its source
+        if ico_path.exists() and ico_path.stat().st_mtime >= icon_path.stat().st_mtime:
+            print("Icon is up to date.")
+            return
+
+        # Imported here, after install_requirements, so the Pillow pip just installed is the one loaded
+        from PIL import Image
+
+        # Downsample each size once with LANCZOS, keeping the aspect ratio and never upscaling,
+        # and hand PIL the finished frames with the largest one first
+        img = Image.open(icon_path).convert('RGBA')
         icon_sizes = [(16,16), (32,32), (48,48), (64,64), (128,128)]
-        img.save('icon.ico', format='ICO', sizes=icon_sizes)
+        frames = []
+        for size in icon_sizes:
+            if size[0] > img.width or size[1] > img.height:
+                continue
+            frame = img.copy()
+            frame.thumbnail(size, Image.Resampling.LANCZOS)
+            frames.append(frame)
+        frames[-1].save(ico_path, format='ICO', sizes=[frame.size for frame in frames],
+                        append_images=frames[:-1])
         print("Icon converted successfully.")
     except Exception as e:
         print(f"Error creating icon: {e}")
         sys.exit(1)
 
-def create_executable():
-    """Create executable using PyInstaller"""
+def create_executable(packages_hash):
+    """Create executable using PyInstaller; packages_hash is what install_requirements returned"""
     try:
-        # Use list of arguments to avoid path escaping issues
-        pyinstaller_command = [
-            'pyinstaller',
+        # PyInstaller separates --add-data source and destination with os.pathsep (';' on Windows, ':' elsewhere)
+        pyinstaller_args = [
             '--name=Wolfie_AV_Player',
             '--icon=icon.ico',
             '--windowed',
             '--onedir',
             '--clean',  # Clean PyInstaller cache
-            '--add-data=icon.png:.',
-            '--add-data=icon.ico:.',
-            '--add-data=video_player_config.json:.',
-            'main.py'
+            f'--add-data=icon.png{os.pathsep}.',
+            f'--add-data=icon.ico{os.pathsep}.',
+            f'--add-data=video_player_config.json{os.pathsep}.',
+            *[f'--exclude-module={module}' for module in EXCLUDED_MODULES]
         ]
 
-        # Adjust for Windows paths if needed
-        if sys.platform.startswith('win'):
-            pyinstaller_command = [
-                'pyinstaller',
-                '--name=Wolfie_AV_Player',
-                '--icon=icon.ico',
-                '--windowed',
-                '--onedir',
-                '--clean',
-                '--add-data=icon.png;.',
-                '--add-data=icon.ico;.',
-                '--add-data=video_player_config.json;.',
-                'main.py'
-            ]
-
-        # Run PyInstaller
-        subprocess.check_call(pyinstaller_command)
+        # Compress binaries with UPX when it is installed
+        upx = shutil.which('upx')
+        pyinstaller_args.append(f'--upx-dir={os.path.dirname(upx)}' if upx else '--noupx')
+
+        # Strip symbols from bundled libraries; the strip tool is only available off Windows
+        if not sys.platform.startswith('win'):
+            pyinstaller_args.append('--strip')
+
+        pyinstaller_args.append(ENTRY_SCRIPT)
+
+        # PyInstaller is by far the slowest step; skip it when no input, option or installed package
+        # changed since the last build
+        sources = {
+            'files': file_hashes(BUILD_INPUTS),
+            'args': pyinstaller_args,
+            'packages': packages_hash
+        }
+        if load_build_cache().get('sources') == sources and executable_path().exists():
+            print("Executable is up to date.")
+            return
+
+        # Run PyInstaller in this interpreter instead of starting a second one
+        importlib.invalidate_caches()  # PyInstaller may have been installed moments ago
+        from PyInstaller.__main__ import run as run_pyinstaller
+        try:
+            run_pyinstaller(pyinstaller_args)
+        except SystemExit as e:
+            # PyInstaller reports failures by calling sys.exit
+            if e.code not in (None, 0):
+                raise RuntimeError(f"PyInstaller exited with status {e.code}")
         print("Executable created successfully!")
-    except subprocess.CalledProcessError as e:
+        update_build_cache('sources', sources)
+    except Exception as e:
         print(f"Error creating executable: {e}")
         sys.exit(1)
 
 def create_inno_setup_script():
     """Create Inno Setup script for installation"""
-    # Use raw string to avoid escaping issues
-    inno_script = r'''[Setup]
-AppName=Wolfie AV Player
-AppVersion=1.0
-AppPublisher=Grey_wolf_indie
-DefaultDirName={autopf}\Wolfie AV Player
-DefaultGroupName=Wolfie AV Player
-AllowNoIcons=yes
-LicenseFile=LICENSE.txt
-OutputDir=installer
-OutputBaseFilename=Wolfie_AV_Player_Setup
-SetupIconFile=icon.ico
-Compression=lzma
-SolidCompression=yes
-WizardStyle=modern
+    script_path = Path('installer') / 'installer_script.iss'
 
-[Languages]
-Name: "english"; MessagesFile: "compiler:Default.isl"
+    # Leave an identical script untouched so its timestamp only changes with its content
+    if script_path.exists() and script_path.read_text(encoding='utf-8') == INNO_SCRIPT:
+        print("Inno Setup script is up to date.")
+        return
 
-[Tasks]
-Name: "desktopicon"; Description: "{cm:CreateDesktopIcon}"; GroupDescription: "{cm:AdditionalIcons}"; Flags: unchecked
-
-[Files]
-Source: "dist\Wolfie_AV_Player\*"; DestDir: "{app}"; Flags: ignoreversion recursesubdirs createallsubdirs
-
-[Icons]
-Name: "{group}\Wolfie AV Player"; Filename: "{app}\Wolfie_AV_Player.exe"
-Name: "{group}\Uninstall Wolfie AV Player"; Filename: "{uninstallexe}"
-Name: "{autodesktop}\Wolfie AV Player"; Filename: "{app}\Wolfie_AV_Player.exe"; Tasks: desktopicon
-
-[Run]
-Filename: "{app}\Wolfie_AV_Player.exe"; Description: "Launch Wolfie AV Player"; Flags: postinstall nowait skipifsilent
-'''
-    
     # Ensure installer directory exists
-    os.makedirs('installer', exist_ok=True)
+    script_path.parent.mkdir(exist_ok=True)
     
     # Write Inno Setup script
-    with open('installer/installer_script.iss', 'w') as f:
-        f.write(inno_script)
+    script_path.write_text(INNO_SCRIPT, encoding='utf-8')
     print("Inno Setup script created successfully.")
 
 def main():
@@ -146,13 +253,13 @@ def main():
         check_python_version()
         
         # Install requirements
-        install_requirements()
+        packages_hash = install_requirements()
         
         # Create icon
         create_icon()
         
         # Create executable
-        create_executable()
+        create_executable(packages_hash)
         
         # Create Inno Setup script
         create_inno_setup_script()